@@ -0,0 +1,31 @@
+# Runs on the VPS, uploaded by fix_compose.py: removes the empty 'volumes:'
+# key from the backend service so `docker compose config` accepts the file.
+import os
+
+COMPOSE_FILE = "/opt/one-ui/docker-compose.yml"
+
+def fix(content):
+    try:
+        import yaml
+    except ImportError:
+        # PyYAML isn't always on the host; in the generated file the empty key
+        # is followed immediately by '    command:'
+        return content.replace('    volumes:\n    command:', '    command:')
+
+    doc = yaml.safe_load(content)
+    backend = doc["services"]["backend"]
+    if "volumes" not in backend or backend["volumes"] is not None:
+        return content
+    del backend["volumes"]
+    return yaml.safe_dump(doc, sort_keys=False)
+
+if __name__ == "__main__":
+    with open(COMPOSE_FILE, 'r') as f:
+        content = f.read()
+    fixed = fix(content)
+    if fixed != content:
+        tmp = COMPOSE_FILE + ".tmp"
+        with open(tmp, 'w') as f:
+            f.write(fixed)
+        os.replace(tmp, COMPOSE_FILE)
+    print('YAML_FIXED')
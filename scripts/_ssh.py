@@ -0,0 +1,200 @@
+"""Shared SSH helper for the VPS maintenance scripts in this directory."""
+
+import atexit
+import os
+import select
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import paramiko
+
+HOST = "139.59.102.74"
+USER = "root"
+KEY_FILE = os.path.expanduser(os.environ.get("VPS_KEY", "~/.ssh/id_ed25519"))
+# Only needed for hosts that don't have the key deployed yet (ssh-copy-id)
+PASSWORD = os.environ.get("VPS_PASSWORD")
+
+# Shell snippet: defines `set_env FILE KEY=VALUE...`, which rewrites FILE in a
+# single awk pass (instead of one `sed -i` per key), appends keys that are
+# missing, and swaps the result in with mv so the update is atomic.
+SET_ENV = """set_env() {
+    local file="$1"
+    shift
+    SET_ENV_PAIRS="$(printf '%s\\n' "$@")" awk '
+        BEGIN {
+            n = split(ENVIRON["SET_ENV_PAIRS"], pairs, "\\n")
+            for (i = 1; i <= n; i++) {
+                key[i] = substr(pairs[i], 1, index(pairs[i], "=") - 1)
+                line[key[i]] = pairs[i]
+            }
+        }
+        {
+            k = substr($0, 1, index($0, "=") - 1)
+            if (k != "" && k in line) { print line[k]; seen[k] = 1; next }
+            print
+        }
+        END { for (i = 1; i <= n; i++) if (key[i] != "" && !(key[i] in seen)) print line[key[i]] }
+    ' "$file" > "$file.tmp"
+    chmod --reference="$file" "$file.tmp"
+    mv "$file.tmp" "$file"
+}"""
+
+# Shell snippet for deploy scripts: defines up_backend, which starts the
+# backend and blocks until its healthcheck passes (`compose up --wait`). The
+# image probes every 2s, so no separate sleep or poll is needed. On failure
+# it shows the logs and returns 1, which stops a `set -e` script. Extra args
+# go to `compose up` (e.g. --build).
+WAIT_TIMEOUT = 90
+UP_BACKEND = f"""up_backend() {{
+    if ! docker compose up -d "$@" --wait --wait-timeout {WAIT_TIMEOUT} backend; then
+        docker logs --tail 50 one-ui-backend 2>&1
+        return 1
+    fi
+    docker logs --tail 20 one-ui-backend 2>&1
+}}"""
+
+# run_ssh timeout for scripts that rebuild the backend: fetch, a worst-case
+# image build (~2 min, with headroom) and up_backend's wait. If the deadline
+# hits first the channel is closed mid-build and the marker is never written.
+DEPLOY_TIMEOUT = 210 + WAIT_TIMEOUT
+
+# Shell snippet for deploy scripts, run from /opt/one-ui after the checkout is
+# updated: rebuild the backend image only when the backend/ tree differs from
+# the last successful build. Otherwise `up` is a no-op unless the container
+# config (e.g. .env) changed. The marker lives in .git so resets never touch it.
+# It also records the image the container ran after that build, so a rebuild
+# by any other script (force_deploy.py, `compose up --build`, ...) no longer
+# matches and the next deploy builds again instead of trusting a stale tree.
+BUILD_BACKEND = UP_BACKEND + """
+tree=$(git rev-parse HEAD:backend)
+image=$(docker inspect -f '{{.Image}}' one-ui-backend 2>/dev/null || true)
+if [ -n "$image" ] && [ "$tree $image" = "$(cat .git/one-ui-backend-tree 2>/dev/null || true)" ]; then
+    echo 'SKIP_BUILD'
+    up_backend
+else
+    up_backend --build
+    echo "$tree $(docker inspect -f '{{.Image}}' one-ui-backend)" > .git/one-ui-backend-tree
+fi"""
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+def connect(host=HOST, password=PASSWORD):
+    # Check the host key against ~/.ssh/known_hosts and refuse unknown or
+    # changed keys, so a password is never sent to whoever answers on the IP.
+    # The key is recorded once by `ssh-copy-id` (or a first manual `ssh`).
+    ssh = paramiko.SSHClient()
+    ssh.load_system_host_keys()
+    ssh.set_missing_host_key_policy(paramiko.RejectPolicy())
+    ssh.connect(
+        host,
+        username=USER,
+        key_filename=KEY_FILE if os.path.exists(KEY_FILE) else None,
+        password=password,
+        timeout=10,
+    )
+    return ssh
+
+def get_client(host=HOST, password=PASSWORD):
+    # One connection per host for the life of the script; every run_ssh call
+    # opens a channel on it instead of doing a new handshake
+    with _clients_lock:
+        ssh = _clients.get(host)
+        if ssh is None:
+            ssh = _clients[host] = connect(host, password)
+        return ssh
+
+@atexit.register
+def close_clients():
+    with _clients_lock:
+        for ssh in _clients.values():
+            ssh.close()
+        _clients.clear()
+
+def run_ssh(command, *, timeout=60, script=None, stream=True, check=False, host=HOST, password=PASSWORD):
+    ssh = get_client(host, password)
+
+    if stream:
+        print(f"\n{'='*60}")
+        print(f"CMD: {command}")
+        if script is not None:
+            print(script.rstrip("\n"))
+        print('='*60)
+        # The header goes through the text layer and the output below is
+        # written as raw bytes, so flush to keep them in order
+        sys.stdout.flush()
+
+    # get_pty merges stderr into stdout, same as the old pty.fork() session.
+    # A script fed on stdin can't go through a pty (it would be echoed back
+    # and never see EOF), so that case merges stderr on the channel instead.
+    stdin, stdout, _ = ssh.exec_command(command, timeout=timeout, get_pty=script is None)
+    channel = stdout.channel
+    if script is not None:
+        channel.set_combine_stderr(True)
+        stdin.write(script)
+        channel.shutdown_write()
+
+    output = bytearray()
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        # The channel also turns readable on EOF, so select can block for the
+        # whole remaining time instead of ticking to poll for exit
+        r, _, _ = select.select([channel], [], [], max(0, deadline - time.time()))
+        if not r:
+            break
+        data = channel.recv(65536)
+        if not data:
+            break
+        output += data
+        if stream:
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+
+    # The exit status arrives around EOF; wait for it within what's left of
+    # the deadline so a failed command is reported instead of swallowed.
+    # -1 means it timed out or the server never sent one.
+    rc = -1
+    if channel.status_event.wait(max(0, deadline - time.time())):
+        rc = channel.recv_exit_status()
+
+    channel.close()
+    # check=True is for a script's main step: stop with the remote status
+    # rather than carry on to a success banner
+    if check and rc != 0:
+        print(f"\n\nFAILED (exit {rc})")
+        sys.exit(rc)
+    return rc, output.decode(errors='replace')
+
+def run_many(commands, *, timeout=60, host=HOST, password=PASSWORD):
+    # Run independent read-only commands side by side, each on its own channel
+    # of the shared transport. Output is buffered rather than streamed so it
+    # doesn't interleave; results come back in the order given. sshd allows 10
+    # sessions per connection by default, so stay under that.
+    get_client(host, password)
+    with ThreadPoolExecutor(max_workers=min(len(commands), 8) or 1) as pool:
+        futures = [
+            pool.submit(run_ssh, cmd, timeout=timeout, stream=False, host=host, password=password)
+            for cmd in commands
+        ]
+        return [f.result() for f in futures]
+
+def run_many_report(steps, *, timeout=60, host=HOST, password=PASSWORD):
+    # Run (title, command) diagnostic steps with run_many, so the total is the
+    # slowest step rather than the sum, then print each under its own header
+    results = run_many([cmd for _, cmd in steps], timeout=timeout, host=host, password=password)
+    for (title, cmd), (rc, output) in zip(steps, results):
+        print(f"\n{'='*60}")
+        print(f"{title}: {cmd}" + (f" (exit {rc})" if rc else ""))
+        print('='*60)
+        print(output, end="")
+
+def put_file(local_path, remote_path, *, host=HOST, password=PASSWORD):
+    # Upload over SFTP on the shared connection, for remote logic that is
+    # easier to keep as a real file than to quote into a shell command
+    sftp = get_client(host, password).open_sftp()
+    try:
+        sftp.put(local_path, remote_path)
+    finally:
+        sftp.close()
@@ -1,66 +1,16 @@
 
-import pty
-import os
-import time
-import select
+from _ssh import run_many_report
 
-HOST = "root@139.59.102.74"
-PASSWORD = "Pan@1991@One"
-
-def run_ssh(command, timeout=15):
-    print(f"\n{'='*60}")
-    print(f"CMD: {command}")
-    print('='*60)
-    
-    pid, fd = pty.fork()
-    if pid == 0:
-        os.execvp("ssh", ["ssh", "-o", "StrictHostKeyChecking=no", "-o", "ConnectTimeout=10", HOST, command])
-    
-    time.sleep(2)
-    try:
-        initial = os.read(fd, 4096).decode(errors='replace')
-    except:
-        pass
-    
-    os.write(fd, (PASSWORD + "\n").encode())
-    time.sleep(1)
-    
-    output = []
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        try:
-            r, _, _ = select.select([fd], [], [], 1)
-            if r:
-                data = os.read(fd, 4096).decode(errors='replace')
-                if not data:
-                    break
-                output.append(data)
-                print(data, end="")
-            else:
-                try:
-                    wpid, status = os.waitpid(pid, os.WNOHANG)
-                    if wpid != 0:
-                        break
-                except:
-                    break
-        except OSError:
-            break
-    
-    try:
-        os.waitpid(pid, os.WNOHANG)
-    except:
-        pass
-    
-    return "".join(output)
-
-if __name__ == "__main__":
+STEPS = [
     # 1. Check if container is running or crashed
-    run_ssh("docker ps -a --filter name=one-ui-backend --format '{{.Names}} {{.Status}}'")
-    
+    ("Container status", "docker ps -a --filter name=one-ui-backend --format '{{.Names}} {{.Status}}'"),
     # 2. Check backend logs
-    run_ssh("docker logs --tail 40 one-ui-backend 2>&1")
-    
+    ("Backend logs", "docker logs --tail 40 one-ui-backend 2>&1"),
     # 3. Check what npm start does
-    run_ssh("cat /opt/one-ui/backend/package.json | grep -A3 '\"start\"'")
+    ("npm start script", "cat /opt/one-ui/backend/package.json | grep -A3 '\"start\"'"),
+]
+
+if __name__ == "__main__":
+    run_many_report(STEPS, timeout=15)
     
     print("\n\nDONE")